@@ -20,13 +20,134 @@ Liste des fonctions proposées pour le calcul et l'affichage des crédits:
 
  Fonction pour le calcul de l'inflation
  - correcteur_inflation
+
+ Résultats retournés par les simulations (tuples nommés d'arrays) :
+ - SimulationInteretsComposes
+ - SimulationCredit
 """
 
+from functools import lru_cache
+import os
+from typing import NamedTuple, Optional
+
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 import numpy as np
 
 
+class SimulationInteretsComposes(NamedTuple):
+    """
+    Résultat de calculer_interets_composes(), qui peut aussi être dépaqueté comme
+    un tuple
+    """
+
+    capitals_mensuels: np.ndarray
+    interets_mensuels_cumules: np.ndarray
+    labels_mois: np.ndarray
+    apports_mensuels_monnaie_actuelle: np.ndarray
+    variation_capital: float
+
+
+class SimulationCredit(NamedTuple):
+    """
+    Résultat de simuler_credit(), qui peut aussi être dépaqueté comme un tuple
+    """
+
+    mensualite: float
+    cout_total_interets: float
+    capital_rembourse_par_mois: np.ndarray
+    capital_restant_par_mois: np.ndarray
+    interets_mensuels: np.ndarray
+    labels_mois: np.ndarray
+
+
+@lru_cache(maxsize=32)
+def _numeroter_mois(duree_en_mois: int, dtype=None):
+    """
+    Retourne la numérotation des mois d'une simulation (0 à duree_en_mois - 1)
+
+    Le même array est partagé par toutes les simulations de même durée et de même
+    type : il est en lecture seule.
+    """
+    labels_mois = np.arange(duree_en_mois, dtype=dtype)
+    labels_mois.flags.writeable = False
+    return labels_mois
+
+
+def _taux_mensuel(taux_annuel):
+    """
+    Retourne le taux mensuel équivalent à un taux annuel, (1 + taux)^(1/12) - 1
+
+    Le calcul passe par log1p/expm1 pour ne pas perdre de précision sur les petits
+    taux, et accepte des arrays de taux.
+    """
+    return np.expm1(np.log1p(taux_annuel) / 12)
+
+
+def _simuler_interets_composes(
+    taux_rentabilite_annuel,
+    capital_initial,
+    apports_mensuels,
+    duree_de_simulation_mois: int,
+    taux_inflation_annuel,
+):
+    """
+    Cœur de calcul de calculer_interets_composes()
+
+    Les taux, le capital initial et les apports peuvent être des arrays : ils sont
+    combinés par broadcasting et les mois sont portés par le dernier axe des
+    séries retournées. Les calculs se font dans la précision des taux fournis
+    (float64 par défaut, float32 si tous les taux sont en float32).
+
+    Retourne :
+    - array : évolution du capital
+    - array : évolution des intérêts générés
+    - array : les apports mensuels en valeur d'aujourd'hui
+    - la variation du capital liée à l'inflation
+    """
+    taux_rentabilite_annuel = np.asarray(taux_rentabilite_annuel)
+    taux_inflation_annuel = np.asarray(taux_inflation_annuel)
+    dtype = np.result_type(taux_rentabilite_annuel, taux_inflation_annuel, np.float32)
+
+    taux_rentabilite_mensuel = _taux_mensuel(taux_rentabilite_annuel)
+    coefficient_inflation_mensuel = 1 + _taux_mensuel(taux_inflation_annuel)
+    capital_initial = np.asarray(capital_initial, dtype=dtype)[..., np.newaxis]
+    apports_mensuels = np.asarray(apports_mensuels, dtype=dtype)[..., np.newaxis]
+    mois = _numeroter_mois(duree_de_simulation_mois, dtype)
+
+    # l'apport du mois n se déprécie de (n+1) mois d'inflation
+    coefficients_deflation = coefficient_inflation_mensuel[..., np.newaxis] ** -(
+        mois + 1
+    )
+    apports_mensuels_monnaie_actuelle = apports_mensuels * coefficients_deflation
+
+    # en monnaie courante, le placement au mois n vaut :
+    # capital_initial*(1+r)^n + apports*((1+r)^0 + ... + (1+r)^n)
+    croissance = (1 + taux_rentabilite_mensuel[..., np.newaxis]) ** mois
+    valeur_placement = capital_initial * croissance + apports_mensuels * np.cumsum(
+        croissance, axis=-1
+    )
+    effort_cumule = capital_initial + apports_mensuels * (mois + 1)
+
+    # capital et intérêts sont ensuite ramenés en monnaie actuelle
+    capitals_mensuels = effort_cumule * coefficients_deflation
+    interets_mensuels_cumules = (
+        valeur_placement - effort_cumule
+    ) * coefficients_deflation
+
+    # variation capital = ce qu'il nous reste en monnaie actuelle - l'effort fourni en monnaie actuelle
+    # variation capital = (capital final en monnaie actuelle) - (capital initial + apports cumulés en monnaie actuelle)
+    variation_capital = capitals_mensuels[..., -1] - (
+        capital_initial[..., 0] + apports_mensuels_monnaie_actuelle.sum(axis=-1)
+    )
+    return (
+        capitals_mensuels,
+        interets_mensuels_cumules,
+        apports_mensuels_monnaie_actuelle,
+        variation_capital,
+    )
+
+
 def calculer_interets_composes(
     taux_rentabilite_annuel: float,
     capital_initial: float,
@@ -43,53 +164,28 @@ def calculer_interets_composes(
     - la durée de simulation en mois
     - le taux d'inflation annuel (facultatif)
 
-    La fonction retournera :
+    La fonction retournera (SimulationInteretsComposes) :
     - array : évolution du capital
     - array : évolution des intérêts générés
     - array : numérotation des mois
     - array : les apports mensuels ramenée en valeur d'aujourd'hui corrigée de l'inflation future
     - retourne la perte en capital (capital initial + apports mensuels) liée à l'inflation
     """
-
-    taux_rentabilite_mensuel = (1 + taux_rentabilite_annuel) ** (1 / float(12)) - 1
-    coefficient_inflation_mensuel = float(
-        (1 + taux_inflation_annuel) ** (1 / float(12))
+    (
+        capitals_mensuels,
+        interets_mensuels_cumules,
+        apports_mensuels_monnaie_actuelle,
+        variation_capital,
+    ) = _simuler_interets_composes(
+        taux_rentabilite_annuel=taux_rentabilite_annuel,
+        capital_initial=capital_initial,
+        apports_mensuels=apports_mensuels,
+        duree_de_simulation_mois=duree_de_simulation_mois,
+        taux_inflation_annuel=taux_inflation_annuel,
     )
+    labels_mois = _numeroter_mois(duree_de_simulation_mois)
 
-    interets_mensuels_cumules = []
-    apports_mensuels_monnaie_actuelle = []
-    capitals_mensuels = []
-    labels_mois = []
-
-    for mois in range(duree_de_simulation_mois):
-        # l'apport mensuel se déprécie par rapport à l'inflation
-        apports_mensuels = apports_mensuels / coefficient_inflation_mensuel
-        apports_mensuels_monnaie_actuelle.append(apports_mensuels)
-        if mois != 0:
-            interets_du_mois_en_cours = (
-                capitals_mensuels[-1] + interets_mensuels_cumules[-1]
-            ) * taux_rentabilite_mensuel
-            interets_mensuels_cumules.append(
-                (interets_mensuels_cumules[-1] + interets_du_mois_en_cours)
-                / coefficient_inflation_mensuel
-            )
-            capitals_mensuels.append(
-                capitals_mensuels[-1] / coefficient_inflation_mensuel + apports_mensuels
-            )
-            labels_mois.append(mois)
-        else:
-            capitals_mensuels.append(
-                capital_initial / coefficient_inflation_mensuel + apports_mensuels
-            )
-            labels_mois.append(0)
-            interets_mensuels_cumules.append(0)
-
-    # variation capital = ce qu'il nous reste en monnaie actuelle - l'effort fourni en monnaie actuelle
-    # variation capital = (capital final en monnaie actuelle) - (capital initial + apports cumulés en monnaie actuelle)
-    variation_capital = capitals_mensuels[-1] - (
-        capital_initial + sum(apports_mensuels_monnaie_actuelle)
-    )
-    return (
+    return SimulationInteretsComposes(
         capitals_mensuels,
         interets_mensuels_cumules,
         labels_mois,
@@ -104,17 +200,20 @@ def afficher_graphique_simulation_interets_composes(
     labels_mois,
     taux_rentabilite_annuel,
     taux_inflation_annuel: float = 0.0,
+    afficher_immediatement: bool = True,
 ):
     """
     Affiche sous forme d'histogramme (barres empilées), l'évolution du capital
     et des intérêts, générés par la fonction calculer_interets_composes()
 
     Paramètres :
-     - liste des valeurs de capitals par mois
-     - liste des intérêts cumulés par mois
-     - liste des labels de mois
+     - array des valeurs de capitals par mois
+     - array des intérêts cumulés par mois
+     - array des labels de mois
      - taux de rentabilité annuel
      - le taux d'inflation (optionnel)
+     - afficher_immediatement : à False, la figure est seulement préparée et sera
+     affichée par un unique plt.show() de l'appelant (optionnel)
     """
 
     width = 0.5  # the width of the bars: can also be len(x) sequence
@@ -139,7 +238,8 @@ def afficher_graphique_simulation_interets_composes(
     )
     ax.legend()
 
-    plt.show()
+    if afficher_immediatement:
+        plt.show()
 
 
 # ### Rapport d'intérêts composés : afficher_rapport_simulation_interets_composes()
@@ -148,12 +248,12 @@ def afficher_graphique_simulation_interets_composes(
 
 def afficher_rapport_simulation_interets_composes(
     capital_initial: int,
-    capitals_mensuels: list[int],
-    interets_mensuels_cumules: list[float],
-    labels_mois: list[int],
+    capitals_mensuels: np.ndarray,
+    interets_mensuels_cumules: np.ndarray,
+    labels_mois: np.ndarray,
     taux_rentabilite_annuel: float,
     mensualites: int,
-    apports_mensuels_monnaie_actuelle: list[float],
+    apports_mensuels_monnaie_actuelle: np.ndarray,
     variation_capital: float,
     taux_inflation_annuel: float = 0,
 ):
@@ -162,9 +262,9 @@ def afficher_rapport_simulation_interets_composes(
     calculés par la fonction calculer_interets_composes
 
     Paramètres :
-    - liste des valeurs de capitals par mois
-    - liste des intérêts cumulés par mois
-    - liste des labels de mois
+    - array des valeurs de capitals par mois
+    - array des intérêts cumulés par mois
+    - array des labels de mois
     - taux de rentabilité annuel
     - les mensualités définies
     - le taux d'inflation (optionnel)
@@ -178,7 +278,7 @@ def afficher_rapport_simulation_interets_composes(
     print(f"Capital (dont capital initial) en monnaie actuelle : {cumul_apports:.2f}")
     print(
         "Apports cumulés en monnaie actuelle :"
-        f" {sum(apports_mensuels_monnaie_actuelle)}"
+        f" {np.sum(apports_mensuels_monnaie_actuelle)}"
     )
     print(
         "Apports cumulés sans correction de l'inflation :"
@@ -201,6 +301,81 @@ def afficher_rapport_simulation_interets_composes(
     )
 
 
+def _echeancier_credit(
+    montant_emprunte_total,
+    nombre_mensualites: int,
+    taux_annuel,
+    taux_inflation_annuel,
+):
+    """
+    Cœur de calcul de simuler_credit()
+
+    Le montant et les taux peuvent être des arrays : ils sont combinés par
+    broadcasting et les mois sont portés par le dernier axe des séries retournées.
+    Les calculs se font dans la précision des taux fournis (float64 par défaut,
+    float32 si tous les taux sont en float32).
+
+    Retourne :
+    - array : mensualité à payer par euro restant dû, pour chaque mois
+    - array : capital remboursé à chaque mois
+    - array : capital restant après le remboursement du mois
+    - array : intérêts remboursés à chaque mois
+    """
+    taux_annuel = np.asarray(taux_annuel)
+    taux_inflation_annuel = np.asarray(taux_inflation_annuel)
+    dtype = np.result_type(taux_annuel, taux_inflation_annuel, np.float32)
+
+    taux_mensuel = _taux_mensuel(taux_annuel)[..., np.newaxis]
+    # déflateur mensuel 1/(1+i) : ramène un montant du mois suivant en valeur du
+    # mois courant
+    deflateur_mensuel = 1 / (1 + _taux_mensuel(taux_inflation_annuel))[..., np.newaxis]
+    montant_emprunte_total = np.asarray(montant_emprunte_total, dtype=dtype)[
+        ..., np.newaxis
+    ]
+
+    # chaque mois, la mensualité est recalculée sur le capital restant dû
+    # et le nombre de mensualités restantes
+    mensualites_restantes = nombre_mensualites - _numeroter_mois(
+        nombre_mensualites, dtype
+    )
+    # (1+t)^n - 1 est calculé par expm1 : pour un petit taux et peu de mensualités
+    # restantes, la soustraction directe perdrait la plupart des chiffres
+    croissance_restante = np.expm1(mensualites_restantes * np.log1p(taux_mensuel))
+    # à taux nul, le capital restant dû est réparti sur les mensualités restantes
+    taux_nul = taux_mensuel == 0
+    mensualite_par_euro_du = np.where(
+        taux_nul,
+        1 / mensualites_restantes,
+        taux_mensuel
+        * (1 + croissance_restante)
+        / np.where(taux_nul, 1, croissance_restante),
+    )
+
+    # avec l'inflation les mensualités et le capital restant diminues chaque mois :
+    # le capital restant dû est multiplié chaque mois par un facteur connu d'avance
+    evolution_capital_restant = (
+        1 + taux_mensuel
+    ) * deflateur_mensuel - mensualite_par_euro_du
+    evolution_cumulee = np.cumprod(evolution_capital_restant, axis=-1)
+    capital_restant_par_mois = montant_emprunte_total * evolution_cumulee
+    capital_du_en_debut_de_mois = montant_emprunte_total * np.concatenate(
+        (np.ones_like(evolution_cumulee[..., :1]), evolution_cumulee[..., :-1]),
+        axis=-1,
+    )
+
+    interets_mensuels = capital_du_en_debut_de_mois * (taux_mensuel * deflateur_mensuel)
+    capital_rembourse_par_mois = (
+        capital_du_en_debut_de_mois * mensualite_par_euro_du - interets_mensuels
+    )
+
+    return (
+        mensualite_par_euro_du,
+        capital_rembourse_par_mois,
+        capital_restant_par_mois,
+        interets_mensuels,
+    )
+
+
 def simuler_credit(
     montant_emprunte_total: float,
     nombre_mensualites: int,
@@ -216,7 +391,7 @@ def simuler_credit(
     - Nombre de mensualités du crédit
     - Taux annuel global du crédit
 
-    Retourne :
+    Retourne (SimulationCredit) :
     - Mensualités du crédit
     - Coût total du crédit
     - array : capital remboursé à chaque mois
@@ -226,56 +401,22 @@ def simuler_credit(
     note : l'index 0 correspond au montant initial du crédit moins le premier remboursement
     qui est effectué par convention dès le J0 du crédit
     """
-
-    mensualite = 0
-    cout_total_interets = 0
-    capital_rembourse_par_mois = [0]
-    capital_restant_par_mois = [montant_emprunte_total]
-    interets_mensuels = [0]
-    labels_mois = [0]
-
-    taux_mensuel = (1 + taux_annuel) ** (1 / float(12)) - 1
-    coefficient_inflation_mensuel = float(
-        (1 + taux_inflation_annuel) ** (1 / float(12))
+    (
+        mensualite_par_euro_du,
+        capital_rembourse_par_mois,
+        capital_restant_par_mois,
+        interets_mensuels,
+    ) = _echeancier_credit(
+        montant_emprunte_total=montant_emprunte_total,
+        nombre_mensualites=nombre_mensualites,
+        taux_annuel=taux_annuel,
+        taux_inflation_annuel=taux_inflation_annuel,
     )
-    premiere_mensualite = mensualite = (
-        montant_emprunte_total * taux_mensuel * (1 + taux_mensuel) ** nombre_mensualites
-    ) / ((1 + taux_mensuel) ** nombre_mensualites - 1)
-
-    # avec l'inflation les mensualités et le capital restant diminues chaque mois
-    cout_total_interets = 0  # mensualite*nombre_mensualites-montant_emprunte_total
-
-    for mois in range(nombre_mensualites):
-        # mensualite = mensualite/coefficient_inflation_mensuel
-        mensualite = (
-            capital_restant_par_mois[-1]
-            * taux_mensuel
-            * (1 + taux_mensuel) ** (nombre_mensualites - mois)
-            / ((1 + taux_mensuel) ** (nombre_mensualites - mois) - 1)
-        )
-        interet_du_mois = (
-            capital_restant_par_mois[-1] * taux_mensuel / coefficient_inflation_mensuel
-        )
+    premiere_mensualite = montant_emprunte_total * mensualite_par_euro_du[0]
+    cout_total_interets = interets_mensuels.sum()
+    labels_mois = _numeroter_mois(nombre_mensualites)
 
-        cout_total_interets += interet_du_mois
-        capital_rembourse_du_mois = mensualite - interet_du_mois
-
-        interets_mensuels.append(interet_du_mois)
-        capital_rembourse_par_mois.append(capital_rembourse_du_mois)
-        capital_restant_par_mois.append(
-            capital_restant_par_mois[-1] / coefficient_inflation_mensuel
-            - capital_rembourse_du_mois
-        )
-
-        labels_mois.append(mois)
-
-    # on supprime le premier item de chaque tableau qui sert juste à initier les calculs
-    capital_rembourse_par_mois.pop(0)
-    capital_restant_par_mois.pop(0)
-    interets_mensuels.pop(0)
-    labels_mois.pop(0)
-
-    return (
+    return SimulationCredit(
         premiere_mensualite,
         cout_total_interets,
         capital_rembourse_par_mois,
@@ -307,14 +448,18 @@ def afficher_rapport_simulation_credit(
 
 
 def afficher_graphique_simulation_credit(
-    capital_rembourse_par_mois: list[float],
-    capital_restant_par_mois: list[float],
-    interets_mensuels: list[float],
-    labels_mois: list[int],
+    capital_rembourse_par_mois: np.ndarray,
+    capital_restant_par_mois: np.ndarray,
+    interets_mensuels: np.ndarray,
+    labels_mois: np.ndarray,
+    afficher_immediatement: bool = True,
 ):
     """
     Affiche un graphique sous forme d'histogramme de barres empilées représentant
     une simulation de crédit retourné par simuler_credit()
+
+    À afficher_immediatement=False, la figure est seulement préparée et sera
+    affichée par un unique plt.show() de l'appelant.
     """
     width = 0.5
     fig, ax = plt.subplots()
@@ -344,7 +489,8 @@ def afficher_graphique_simulation_credit(
     ax.set_title("Remboursement du crédit : part du capital et des intérêts")
     ax.legend()
 
-    plt.show()
+    if afficher_immediatement:
+        plt.show()
 
 
 def calculer_capital(mensualite: float, taux_annuel: float, duree_en_mois: int):
@@ -353,31 +499,44 @@ def calculer_capital(mensualite: float, taux_annuel: float, duree_en_mois: int):
     -d'une mensulaté fixe
     -un taux annuel
     -la durée du crédit
+
+    Les paramètres peuvent être des listes ou des arrays : ils sont combinés par
+    broadcasting et le capital est alors retourné pour chaque combinaison.
     """
-    taux_mensuel = (1 + taux_annuel) ** (1 / float(12)) - 1
+    mensualite, taux_annuel, duree_en_mois = np.broadcast_arrays(
+        mensualite, taux_annuel, duree_en_mois
+    )
+    # les montants et durées suivent la précision des taux (float64 par défaut)
+    dtype = np.result_type(taux_annuel, np.float32)
+    mensualite = mensualite.astype(dtype, copy=False)
+    duree_en_mois = duree_en_mois.astype(dtype, copy=False)
+
+    taux_mensuel = _taux_mensuel(taux_annuel)
+    # 1 - (1+t)^-n, calculé par expm1 pour rester précis sur les petits taux
     capital = (
-        mensualite * (1 - (1 + taux_mensuel) ** (-1 * duree_en_mois)) / taux_mensuel
+        mensualite
+        * -np.expm1(-duree_en_mois * np.log1p(taux_mensuel))
+        / np.where(taux_mensuel == 0, 1, taux_mensuel)
     )
+    # à taux nul, le capital est la somme des mensualités
+    capital = np.where(taux_mensuel == 0, mensualite * duree_en_mois, capital)
 
-    return capital
+    # un calcul sur des paramètres scalaires retourne un scalaire
+    return capital[()]
 
 
 def correcteur_inflation(taux_annuel: float, duree_de_simulation_en_annees: int):
     """
     Permet de corriger un montant futur de l'inflation future pour le ramener
     en valeur acutelle.
-    Retourne un tableaux de coefficients, selon le mois.
+    Retourne un array de coefficients, selon le mois, et l'array des mois.
     """
-    coefficients = [1]
-    labels_mois = [0]
+    coefficient_inflation_mensuel = 1 - _taux_mensuel(taux_annuel)
 
-    coefficient_inflation_mensuel = 2 - (1 + taux_annuel) ** (1 / float(12))
-
-    for annee in range(duree_de_simulation_en_annees):
-        for mois in range(12):
-            if annee != 0 or mois != 0:
-                coefficients.append(coefficients[-1] * coefficient_inflation_mensuel)
-                labels_mois.append(annee * 12 + mois)
+    # le coefficient du mois n vaut coefficient_inflation_mensuel^n (le mois 0,
+    # à 1, est toujours présent)
+    labels_mois = _numeroter_mois(max(duree_de_simulation_en_annees * 12, 1))
+    coefficients = coefficient_inflation_mensuel**labels_mois
 
     return coefficients, labels_mois
 
@@ -612,6 +771,110 @@ def evaluer_strategies(
     return (capital, benefice_net_strat1, benefice_net_strat2)
 
 
+def _benefice_strategie1(
+    mensualites, duree_de_simulation: int, taux_rentabilite_annuel, taux_inflation
+):
+    """
+    Bénéfice net de la stratégie 1 d'evaluer_strategies(), sans construire le
+    rapport. Les taux peuvent être des arrays combinés par broadcasting.
+    """
+    _, interets_mensuels_cumules, _, variation_capital = _simuler_interets_composes(
+        taux_rentabilite_annuel=taux_rentabilite_annuel,
+        capital_initial=0,
+        apports_mensuels=mensualites,
+        duree_de_simulation_mois=duree_de_simulation,
+        taux_inflation_annuel=taux_inflation,
+    )
+    return interets_mensuels_cumules[..., -1] + variation_capital
+
+
+def _credit_strategie2(
+    mensualites, duree_de_simulation: int, taux_general_credit, taux_inflation
+):
+    """
+    Capital emprunté et coût total des intérêts du crédit de la stratégie 2
+    d'evaluer_strategies(). Le crédit ne dépend pas de la rentabilité du placement.
+    Les taux peuvent être des arrays combinés par broadcasting.
+    """
+    capital = calculer_capital(
+        mensualite=mensualites,
+        taux_annuel=taux_general_credit,
+        duree_en_mois=duree_de_simulation,
+    )
+    _, _, _, interets_credit = _echeancier_credit(
+        montant_emprunte_total=capital,
+        nombre_mensualites=duree_de_simulation,
+        taux_annuel=taux_general_credit,
+        taux_inflation_annuel=taux_inflation,
+    )
+    return capital, interets_credit.sum(axis=-1)
+
+
+def _benefice_strategie2(
+    capital,
+    cout_total_interets,
+    duree_de_simulation: int,
+    taux_rentabilite_annuel,
+    taux_inflation,
+):
+    """
+    Bénéfice net de la stratégie 2 d'evaluer_strategies(), pour un crédit calculé
+    par _credit_strategie2(), sans construire le rapport. Les paramètres peuvent
+    être des arrays combinés par broadcasting.
+    """
+    _, interets_mensuels_cumules, _, variation_capital = _simuler_interets_composes(
+        taux_rentabilite_annuel=taux_rentabilite_annuel,
+        capital_initial=capital,
+        apports_mensuels=0,
+        duree_de_simulation_mois=duree_de_simulation,
+        taux_inflation_annuel=taux_inflation,
+    )
+    return interets_mensuels_cumules[..., -1] - cout_total_interets + variation_capital
+
+
+def _comparer_strategies(
+    mensualites,
+    duree_de_simulation: int,
+    taux_rentabilite_annuel,
+    taux_general_credit,
+    taux_inflation,
+):
+    """
+    Évalue les deux stratégies d'evaluer_strategies() pour toutes les combinaisons
+    de taux, données sous forme d'arrays combinés par broadcasting (par exemple
+    rentabilités en colonne et taux de crédit en ligne).
+
+    Retourne, arrondis à l'unité inférieure en valeur absolue :
+    -l'avantage de la stratégie 2 sur la stratégie 1
+    -le bénéfice net de la stratégie 2
+    -le bénéfice de la stratégie 1
+    """
+    benefices_strat1 = _benefice_strategie1(
+        mensualites, duree_de_simulation, taux_rentabilite_annuel, taux_inflation
+    )
+    # le crédit ne dépend pas de la rentabilité : il n'est calculé que sur les axes
+    # des taux de crédit et d'inflation
+    capital_emprunte_strat2, cout_credit_strat2 = _credit_strategie2(
+        mensualites, duree_de_simulation, taux_general_credit, taux_inflation
+    )
+    benefices_nets_strat2 = _benefice_strategie2(
+        capital_emprunte_strat2,
+        cout_credit_strat2,
+        duree_de_simulation,
+        taux_rentabilite_annuel,
+        taux_inflation,
+    )
+
+    forme = np.broadcast_shapes(benefices_strat1.shape, benefices_nets_strat2.shape)
+    avantage_strat2 = (benefices_nets_strat2 - benefices_strat1).astype(np.int64)
+    benefices_nets_strat2 = np.broadcast_to(benefices_nets_strat2, forme).astype(
+        np.int64
+    )
+    benefices_strat1 = np.broadcast_to(benefices_strat1, forme).astype(np.int64)
+
+    return avantage_strat2, benefices_nets_strat2, benefices_strat1
+
+
 def comparer_strategies_selon_rentabilite_et_credit(
     mensualite: int,
     duree_de_simulation: int,
@@ -626,55 +889,48 @@ def comparer_strategies_selon_rentabilite_et_credit(
     Stratégie 1 : placement régulier sans emprunt
     Stratégie 2 : placement d'un capital obtenu par emprunt
 
-    Retourne :
+    Retourne, sous forme d'arrays indexés par [taux de rentabilité, taux du crédit] :
     -l'avantage de la stratégie 2 sur la stratégie 1
-    -le bénéfice de la stratégie 1 (placement régulier sans emprunt)
     -le bénéfice net de la stratégie 2
+    -le bénéfice de la stratégie 1 (placement régulier sans emprunt)
     """
-    avantage_strat2 = []
-    benefices_nets_strat2 = (
-        []
-    )  # représente les intérêts générés par la strat2-le cout du crédit
-    benefices_strat1 = []
-
-    for taux_rentabilite_annuel in liste_taux_de_rentatibilite_annuel_placement:
-        avantage_strat2_a_rentabilite_constante = []
-        benef_net_strat2_a_rentabilite_constante = []
-        benef_strat1_a_rentabilite_constante = []
-        for taux_general_credit in liste_taux_general_credit:
-            (capital_emprunte_strat2, benef_strat1, benef_strat2) = evaluer_strategies(
-                mensualites=mensualite,
-                duree_de_simulation=duree_de_simulation,
-                taux_de_rentabilite_annuel_placement=taux_rentabilite_annuel,
-                taux_annuel_general_credit=taux_general_credit,
-                taux_annuel_inflation=taux_inflation_annuel,
-                afficher=False,
-            )
-            avantage_strat2_a_rentabilite_constante.append(
-                int(benef_strat2 - benef_strat1)
-            )
-            benef_net_strat2_a_rentabilite_constante.append(int(benef_strat2))
-            benef_strat1_a_rentabilite_constante.append(int(benef_strat1))
-        avantage_strat2.append(avantage_strat2_a_rentabilite_constante)
-        benefices_nets_strat2.append(benef_net_strat2_a_rentabilite_constante)
-        benefices_strat1.append(benef_strat1_a_rentabilite_constante)
-
-    return avantage_strat2, benefices_nets_strat2, benefices_strat1
+    # toutes les cases de la grille sont évaluées d'un seul tenant :
+    # rentabilités en colonne, taux de crédit en ligne
+    # (le bénéfice net de la strat2 représente les intérêts générés par la strat2
+    # moins le cout du crédit)
+    return _comparer_strategies(
+        mensualite,
+        duree_de_simulation,
+        np.asarray(liste_taux_de_rentatibilite_annuel_placement)[:, np.newaxis],
+        np.asarray(liste_taux_general_credit)[np.newaxis, :],
+        taux_inflation_annuel,
+    )
 
 
 def afficher_graphique_comparaison_strategies_selon_rentabilite_et_credit(
     duree_de_simulation: int,
     mensualites: int,
-    benefices_strat1: list[float],
-    benefices_nets_strat2: list[float],
-    avantage_strat2: list[float],
+    benefices_strat1: np.ndarray,
+    benefices_nets_strat2: np.ndarray,
+    avantage_strat2: np.ndarray,
     taux_general_credit: list[float],
     taux_rentabilite_annuel_placement: list[float],
     titre_figure: str,
+    afficher_immediatement: bool = True,
+    fig=None,
 ):
     """
     Afficheur de comparateur de stratégies explorant différents scénarios avec
     différentes taux de rentabilités et différents taux de crédit.
+
+    À afficher_immediatement=False, la figure est seulement préparée et sera
+    affichée par un unique plt.show() de l'appelant.
+
+    Une figure retournée par un précédent appel, pour les mêmes listes de taux,
+    peut être passée dans fig : elle est alors mise à jour (couleurs, bornes et
+    annotations) au lieu d'en construire une nouvelle.
+
+    Retourne la figure.
     """
     epargne_totale = duree_de_simulation * mensualites
 
@@ -682,89 +938,72 @@ def afficher_graphique_comparaison_strategies_selon_rentabilite_et_credit(
         "custom", ["royalblue", "orange", "darkred"]
     )
 
-    max = np.max(
-        [
-            np.max(benefices_strat1),
-            np.max(benefices_nets_strat2),
-            np.max(avantage_strat2),
-        ]
-    )
-    min = np.min(
-        [
-            np.min(benefices_strat1),
-            np.min(benefices_nets_strat2),
-            np.min(avantage_strat2),
-        ]
-    )
+    resultats = [
+        np.asarray(valeurs)
+        for valeurs in (benefices_strat1, benefices_nets_strat2, avantage_strat2)
+    ]
 
-    fig, ax = plt.subplots(1, 3, sharey=False)
+    # bornes communes de l'échelle de couleurs des trois graphiques
+    toutes_valeurs = np.concatenate([np.ravel(valeurs) for valeurs in resultats])
+    vmin, vmax = toutes_valeurs.min(), toutes_valeurs.max()
 
-    # on ajoute les légendes et le contenu
-    fig.suptitle(titre_figure)
-    fig.supxlabel(f"Effort total : {epargne_totale}")
+    # valeurs annotées dans les cases, en milliers tronqués vers zéro
+    valeurs_en_milliers = [(valeurs / 1000).astype(np.int64) for valeurs in resultats]
 
-    ax[0].set_title("Bénéfices strat1 (en k)")
-    ax[0].imshow(benefices_strat1, vmin=min, vmax=max, cmap=cmap)
-
-    ax[1].set_title("Bénéfices strat2 (en k)")
-    ax[1].imshow(benefices_nets_strat2, vmin=min, vmax=max, cmap=cmap)
-
-    ax[2].set_title("Avantage strat2 (en k)")
-    ax[2].imshow(avantage_strat2, vmin=min, vmax=max, cmap=cmap)
-
-    # on redimensionne le graphique
-    largeur = 3 * len(taux_general_credit) * 0.5 + 5
-    hauteur = len(taux_rentabilite_annuel_placement) * 0.6 + 3
-    ax[0].figure.set_size_inches(largeur, hauteur)
-
-    # on ajoute les labels en abscisse
-    for a in ax:
-        a.set_xlabel("Taux d'emprunt (%)")
-        ax[0].set_ylabel("Taux de rendement (%)")
-
-    # on configure les axes x et y de chaque graphique
-    for a in ax:
-        a.get_xaxis().set_ticks(range(len(taux_general_credit)))
-        a.get_xaxis().set_ticklabels(np.array(taux_general_credit) * 100)
-        a.get_yaxis().set_ticks(range(len(taux_rentabilite_annuel_placement)))
-        a.get_yaxis().set_ticklabels(np.array(taux_rentabilite_annuel_placement) * 100)
-        a.invert_yaxis()
-
-    # annotations dans chaque case (x3)
-    for i in range(len(taux_rentabilite_annuel_placement)):
-        for j in range(len(taux_general_credit)):
-            text = ax[0].text(
-                j,
-                i,
-                int(benefices_strat1[i][j] / 1000),
-                ha="center",
-                va="center",
-                color="w",
-            )
+    if fig is None:
+        fig, ax = plt.subplots(1, 3, sharey=False)
 
-    for i in range(len(taux_rentabilite_annuel_placement)):
-        for j in range(len(taux_general_credit)):
-            text = ax[1].text(
-                j,
-                i,
-                int(benefices_nets_strat2[i][j] / 1000),
-                ha="center",
-                va="center",
-                color="w",
-            )
+        # on ajoute les légendes et le contenu
+        ax[0].set_title("Bénéfices strat1 (en k)")
+        ax[0].imshow(benefices_strat1, vmin=vmin, vmax=vmax, cmap=cmap)
+
+        ax[1].set_title("Bénéfices strat2 (en k)")
+        ax[1].imshow(benefices_nets_strat2, vmin=vmin, vmax=vmax, cmap=cmap)
+
+        ax[2].set_title("Avantage strat2 (en k)")
+        ax[2].imshow(avantage_strat2, vmin=vmin, vmax=vmax, cmap=cmap)
 
-    for i in range(len(taux_rentabilite_annuel_placement)):
-        for j in range(len(taux_general_credit)):
-            text = ax[2].text(
-                j,
-                i,
-                int(avantage_strat2[i][j] / 1000),
-                ha="center",
-                va="center",
-                color="w",
+        # on redimensionne le graphique
+        largeur = 3 * len(taux_general_credit) * 0.5 + 5
+        hauteur = len(taux_rentabilite_annuel_placement) * 0.6 + 3
+        ax[0].figure.set_size_inches(largeur, hauteur)
+
+        # on ajoute les labels en abscisse
+        for a in ax:
+            a.set_xlabel("Taux d'emprunt (%)")
+            ax[0].set_ylabel("Taux de rendement (%)")
+
+        # on configure les axes x et y de chaque graphique
+        for a in ax:
+            a.get_xaxis().set_ticks(range(len(taux_general_credit)))
+            a.get_xaxis().set_ticklabels(np.array(taux_general_credit) * 100)
+            a.get_yaxis().set_ticks(range(len(taux_rentabilite_annuel_placement)))
+            a.get_yaxis().set_ticklabels(
+                np.array(taux_rentabilite_annuel_placement) * 100
             )
+            a.invert_yaxis()
+
+        # annotations dans chaque case des trois graphiques
+        for i, j in np.ndindex(valeurs_en_milliers[0].shape):
+            for a, milliers in zip(ax, valeurs_en_milliers):
+                a.text(j, i, milliers[i, j], ha="center", va="center", color="w")
+    else:
+        # seuls les contenus de la figure existante sont remplacés
+        ax = fig.axes
+        for a, valeurs, milliers in zip(ax, resultats, valeurs_en_milliers):
+            a.images[0].set_data(valeurs)
+            a.images[0].set_clim(vmin, vmax)
+            for text, valeur in zip(a.texts, milliers.ravel()):
+                text.set_text(valeur)
+
+    # titres communs (remplacés s'ils existent déjà)
+    fig.suptitle(titre_figure)
+    fig.supxlabel(f"Effort total : {epargne_totale}")
+
+    if afficher_immediatement:
+        plt.show()
 
-    plt.show()
+    return fig
 
 
 def comparer_strategies_selon_rentabilite_inflation_credit(
@@ -773,6 +1012,8 @@ def comparer_strategies_selon_rentabilite_inflation_credit(
     taux_general_credit: list[float],
     taux_rentabilite_annuel: list[float],
     taux_inflation_annuel: list[float],
+    afficher_immediatement: bool = True,
+    dossier_sortie: Optional[str] = None,
 ):
     """
     Compare deux stratégies en faisant varier les paramètres de rentabilité
@@ -781,31 +1022,69 @@ def comparer_strategies_selon_rentabilite_inflation_credit(
     Stratégie 1 : placement régulier sans emprunt
     Stratégie 2 : placement d'un capital obtenu par emprunt
 
-    Affiche une série de tableaux
-    """
-    for inflation in taux_inflation_annuel:
-        (
-            avantage_strat2,
-            benefices_nets_strat2,
-            benefices_strat1,
-        ) = comparer_strategies_selon_rentabilite_et_credit(
-            mensualite=mensualites,
-            duree_de_simulation=duree_simulation,
-            liste_taux_de_rentatibilite_annuel_placement=taux_rentabilite_annuel,
-            liste_taux_general_credit=taux_general_credit,
-            taux_inflation_annuel=inflation,
-        )
+    Affiche une série de tableaux, un par taux d'inflation (à
+    afficher_immediatement=False, ils sont préparés pour un unique plt.show())
 
-        afficher_graphique_comparaison_strategies_selon_rentabilite_et_credit(
-            duree_de_simulation=duree_simulation,
-            mensualites=mensualites,
-            benefices_strat1=benefices_strat1,
-            benefices_nets_strat2=benefices_nets_strat2,
-            avantage_strat2=avantage_strat2,
-            taux_rentabilite_annuel_placement=taux_rentabilite_annuel,
-            taux_general_credit=taux_general_credit,
-            titre_figure=(
-                f"Apport mensuel de {mensualites} sur {duree_simulation/12} ans avec"
-                f" une inflation de {inflation*100} %"
-            ),
-        )
+    Si dossier_sortie est renseigné, rien n'est affiché : une seule figure est
+    redessinée pour chaque taux d'inflation et enregistrée dans
+    dossier_sortie/inflation_<taux en %>.png (le dossier est créé s'il n'existe
+    pas), puis fermée.
+
+    Retourne, sous forme d'arrays indexés par
+    [taux de rentabilité, taux du crédit, taux d'inflation] :
+    -l'avantage de la stratégie 2 sur la stratégie 1
+    -le bénéfice net de la stratégie 2
+    -le bénéfice de la stratégie 1
+
+    Les calculs se font dans la précision des taux fournis : des arrays en float32
+    divisent par deux la mémoire de la grille de scénarios.
+    """
+    # les scénarios sont évalués d'un seul tenant sur une grille
+    # (rentabilité, crédit, inflation)
+    taux_rentabilite = np.asarray(taux_rentabilite_annuel)[:, np.newaxis, np.newaxis]
+    taux_credit = np.asarray(taux_general_credit)[np.newaxis, :, np.newaxis]
+    taux_inflation = np.asarray(taux_inflation_annuel)[np.newaxis, np.newaxis, :]
+
+    avantage_strat2, benefices_nets_strat2, benefices_strat1 = _comparer_strategies(
+        mensualites, duree_simulation, taux_rentabilite, taux_credit, taux_inflation
+    )
+
+    if dossier_sortie is not None:
+        os.makedirs(dossier_sortie, exist_ok=True)
+
+    fig = None
+    try:
+        for k, inflation in enumerate(taux_inflation_annuel):
+            # float() pour ne pas afficher les décimales parasites d'un taux float32
+            inflation_pourcents = float(inflation) * 100
+            fig = afficher_graphique_comparaison_strategies_selon_rentabilite_et_credit(
+                duree_de_simulation=duree_simulation,
+                mensualites=mensualites,
+                benefices_strat1=benefices_strat1[:, :, k],
+                benefices_nets_strat2=benefices_nets_strat2[:, :, k],
+                avantage_strat2=avantage_strat2[:, :, k],
+                taux_rentabilite_annuel_placement=taux_rentabilite_annuel,
+                taux_general_credit=taux_general_credit,
+                titre_figure=(
+                    f"Apport mensuel de {mensualites} sur {duree_simulation/12} ans"
+                    f" avec une inflation de {inflation_pourcents:g} %"
+                ),
+                afficher_immediatement=(
+                    afficher_immediatement and dossier_sortie is None
+                ),
+                # en mode enregistrement, la même figure est réutilisée
+                fig=fig if dossier_sortie is not None else None,
+            )
+            if dossier_sortie is not None:
+                fig.savefig(
+                    os.path.join(
+                        dossier_sortie, f"inflation_{inflation_pourcents:g}.png"
+                    ),
+                    dpi=100,
+                )
+    finally:
+        # la figure réutilisée est fermée même si un enregistrement échoue
+        if dossier_sortie is not None and fig is not None:
+            plt.close(fig)
+
+    return avantage_strat2, benefices_nets_strat2, benefices_strat1